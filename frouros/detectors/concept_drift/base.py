@@ -189,12 +189,16 @@ class BaseConceptDrift(BaseDetector):
         :return: callbacks logs
         :rtype: dict[str, Any]]
         """
-        for callback in self.callbacks:  # type: ignore
+        if not self.callbacks:
+            # Hot path: no callback hooks to run nor logs to collect
+            self._update(value=value, **kwargs)
+            return {}
+        for callback in self.callbacks:
             callback.on_update_start(  # type: ignore
                 value=value,
             )
         self._update(value=value, **kwargs)
-        for callback in self.callbacks:  # type: ignore
+        for callback in self.callbacks:
             callback.on_update_end(  # type: ignore
                 value=value,
             )
@@ -1,10 +1,8 @@
 """EDDM (Early drift detection method) module."""
 
-import copy
+import math
 from typing import Any, Optional, Union
 
-import numpy as np
-
 from frouros.callbacks.streaming.base import BaseCallbackStreaming
 from frouros.detectors.concept_drift.streaming.statistical_process_control.base import (
     BaseSPC,
@@ -189,7 +187,7 @@ class EDDM(BaseSPC):
             "max_distance_threshold": float("-inf"),
             "mean_distance_error": mean_distance_error,
             "num_misclassified_instances": 0,
-            "old_mean_distance_error": copy.copy(mean_distance_error),
+            "old_mean_distance_error": mean_distance_error,
             "std_distance_error": 0.0,
             "variance_distance_error": 0.0,
             **self.additional_vars,  # type: ignore
@@ -343,54 +341,64 @@ class EDDM(BaseSPC):
         self._additional_vars["variance_distance_error"] = value
 
     def _update(self, value: Union[int, float], **kwargs: Any) -> None:
-        self.num_instances += 1
+        # Hot path: the whole update is computed in a single frame on local
+        # variables, and the validating property setters are bypassed (the
+        # values written below are non-negative by construction)
+        self._num_instances += 1
+        num_instances = self._num_instances
+        additional_vars = self._additional_vars
 
         if value == 1:
-            self.num_misclassified_instances += 1
-
-            distance = self.num_instances - self.last_distance_error
-            self.old_mean_distance_error = self.mean_distance_error
-            self.mean_distance_error += (
-                distance - self.mean_distance_error
-            ) / self.num_misclassified_instances
-            self.variance_distance_error += (distance - self.mean_distance_error) * (
-                distance - self.old_mean_distance_error
+            num_misclassified_instances = (
+                additional_vars["num_misclassified_instances"] + 1
+            )
+            # Welford's incremental mean and variance of the distance
+            distance = num_instances - additional_vars["last_distance_error"]
+            old_mean_distance_error = additional_vars["mean_distance_error"]
+            mean_distance_error = (
+                old_mean_distance_error
+                + (distance - old_mean_distance_error) / num_misclassified_instances
             )
-            self.std_distance_error = (
-                np.sqrt(self.variance_distance_error / self.num_misclassified_instances)
-                if self.num_misclassified_instances > 0
-                else 0.0
+            variance_distance_error = additional_vars["variance_distance_error"] + (
+                distance - mean_distance_error
+            ) * (distance - old_mean_distance_error)
+            # num_misclassified_instances >= 1, it has just been incremented
+            std_distance_error = math.sqrt(
+                variance_distance_error / num_misclassified_instances
             )
-            self.last_distance_error = self.num_instances
 
+            additional_vars["num_misclassified_instances"] = num_misclassified_instances
+            additional_vars["old_mean_distance_error"] = old_mean_distance_error
+            additional_vars["mean_distance_error"] = mean_distance_error
+            additional_vars["variance_distance_error"] = variance_distance_error
+            additional_vars["std_distance_error"] = std_distance_error
+            additional_vars["last_distance_error"] = num_instances
+
+            config = self.config
             if (
-                self.num_instances >= self.config.min_num_misclassified_instances  # type: ignore # noqa: E501
+                num_instances >= config.min_num_misclassified_instances  # type: ignore
             ):
                 distance_threshold = (
-                    self.mean_distance_error
-                    + self.config.level * self.std_distance_error  # type: ignore
+                    mean_distance_error + config.level * std_distance_error  # type: ignore
                 )
-                if distance_threshold > self.max_distance_threshold:
-                    self.max_distance_threshold = distance_threshold
-                    self.drift, self.warning = False, False
+                max_distance_threshold = additional_vars["max_distance_threshold"]
+                if distance_threshold > max_distance_threshold:
+                    additional_vars["max_distance_threshold"] = distance_threshold
+                    self.drift, additional_vars["warning"] = False, False
                 elif (
-                    self.num_misclassified_instances
-                    >= self.config.min_num_misclassified_instances  # type: ignore
+                    num_misclassified_instances
+                    >= config.min_num_misclassified_instances  # type: ignore
                 ):
-                    p = distance_threshold / self.max_distance_threshold
-                    if p < self.config.beta:  # type: ignore
+                    p = distance_threshold / max_distance_threshold
+                    if p < config.beta:  # type: ignore
                         # Out-of-Control
-                        self.drift = True
-                        self.warning = False
+                        self.drift, additional_vars["warning"] = True, False
                     else:
-                        if p < self.config.alpha:  # type: ignore
-                            # Warning
-                            self.warning = True
-                        else:
-                            self.warning = False
+                        # Warning
                         self.drift = False
+                        additional_vars["warning"] = p < config.alpha  # type: ignore
         else:
-            self.drift, self.warning = False, False
+            self.drift, additional_vars["warning"] = False, False
 
     def reset(self) -> None:
         """Reset method."""
@@ -399,6 +407,6 @@ class EDDM(BaseSPC):
         self.max_distance_threshold = float("-inf")
         self.mean_distance_error = 0.0
         self.num_misclassified_instances = 0
-        self.old_mean_distance_error = copy.copy(self.mean_distance_error)
+        self.old_mean_distance_error = self.mean_distance_error
         self.std_distance_error = 0.0
         self.variance_distance_error = 0.0
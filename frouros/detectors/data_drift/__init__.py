@@ -1,26 +1,30 @@
 """Data drift detection methods init."""
 
-from .batch import (  # noqa: F401
-    EMD,
-    JS,
-    KL,
-    MMD,
-    PSI,
-    AndersonDarlingTest,
-    BhattacharyyaDistance,
-    BWSTest,
-    ChiSquareTest,
-    CVMTest,
-    EnergyDistance,
-    HellingerDistance,
-    HINormalizedComplement,
-    KSTest,
-    KuiperTest,
-    MannWhitneyUTest,
-    WelchTTest,
-)
-from .streaming import MMD as MMDStreaming
-from .streaming import IncrementalKSTest  # noqa: N811
+import importlib
+from typing import TYPE_CHECKING, Any, Tuple
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .batch import (  # noqa: F401
+        EMD,
+        JS,
+        KL,
+        MMD,
+        PSI,
+        AndersonDarlingTest,
+        BhattacharyyaDistance,
+        BWSTest,
+        ChiSquareTest,
+        CVMTest,
+        EnergyDistance,
+        HellingerDistance,
+        HINormalizedComplement,
+        KSTest,
+        KuiperTest,
+        MannWhitneyUTest,
+        WelchTTest,
+    )
+    from .streaming import MMD as MMDStreaming
+    from .streaming import IncrementalKSTest  # noqa: N811
 
 __all__ = [
     "AndersonDarlingTest",
@@ -41,3 +45,66 @@ __all__ = [
     "MMDStreaming",
     "WelchTTest",
 ]
+
+# Detectors are imported on first access (PEP 562), so only the subpackages
+# that are used get imported. Values are (module, attribute name) pairs
+_LAZY_IMPORTS: dict[str, Tuple[str, str]] = {
+    **{
+        name: (".batch", name)
+        for name in [
+            "AndersonDarlingTest",
+            "BhattacharyyaDistance",
+            "BWSTest",
+            "ChiSquareTest",
+            "CVMTest",
+            "EMD",
+            "EnergyDistance",
+            "HellingerDistance",
+            "HINormalizedComplement",
+            "JS",
+            "KL",
+            "KSTest",
+            "KuiperTest",
+            "MannWhitneyUTest",
+            "MMD",
+            "PSI",
+            "WelchTTest",
+        ]
+    },
+    "IncrementalKSTest": (".streaming", "IncrementalKSTest"),
+    "MMDStreaming": (".streaming", "MMD"),
+}
+
+# Subpackages are imported on first access too
+_SUBPACKAGES = {"batch", "streaming"}
+
+
+def __getattr__(name: str) -> Any:
+    """Import detectors lazily.
+
+    :param name: attribute name
+    :type name: str
+    :raises AttributeError: Attribute error exception
+    :return: attribute value
+    :rtype: Any
+    """
+    if name in _LAZY_IMPORTS:
+        module_name, attr_name = _LAZY_IMPORTS[name]
+        module = importlib.import_module(module_name, __name__)
+        value = getattr(module, attr_name)
+        # Cache it, so __getattr__ is not called again for this name
+        globals()[name] = value
+        return value
+    if name in _SUBPACKAGES:
+        # Importing a subpackage also sets it as an attribute of this package
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    """Module attributes, including the ones not imported yet.
+
+    :return: attribute names
+    :rtype: list[str]
+    """
+    return sorted({*globals(), *_LAZY_IMPORTS, *_SUBPACKAGES})
@@ -1,26 +1,30 @@
 """Data drift batch detection methods init."""
 
-from .distance_based import (
-    EMD,
-    JS,
-    KL,
-    MMD,
-    PSI,
-    BhattacharyyaDistance,
-    EnergyDistance,
-    HellingerDistance,
-    HINormalizedComplement,
-)
-from .statistical_test import (
-    AndersonDarlingTest,
-    BWSTest,
-    ChiSquareTest,
-    CVMTest,
-    KSTest,
-    KuiperTest,
-    MannWhitneyUTest,
-    WelchTTest,
-)
+import importlib
+from typing import TYPE_CHECKING, Any, Tuple
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .distance_based import (
+        EMD,
+        JS,
+        KL,
+        MMD,
+        PSI,
+        BhattacharyyaDistance,
+        EnergyDistance,
+        HellingerDistance,
+        HINormalizedComplement,
+    )
+    from .statistical_test import (
+        AndersonDarlingTest,
+        BWSTest,
+        ChiSquareTest,
+        CVMTest,
+        KSTest,
+        KuiperTest,
+        MannWhitneyUTest,
+        WelchTTest,
+    )
 
 __all__ = [
     "AndersonDarlingTest",
@@ -41,3 +45,69 @@ __all__ = [
     "MMD",
     "WelchTTest",
 ]
+
+# Detectors are imported on first access (PEP 562), so only the subpackages
+# that are used get imported. Values are (module, attribute name) pairs
+_LAZY_IMPORTS: dict[str, Tuple[str, str]] = {
+    **{
+        name: (".distance_based", name)
+        for name in [
+            "BhattacharyyaDistance",
+            "EMD",
+            "EnergyDistance",
+            "HellingerDistance",
+            "HINormalizedComplement",
+            "JS",
+            "KL",
+            "MMD",
+            "PSI",
+        ]
+    },
+    **{
+        name: (".statistical_test", name)
+        for name in [
+            "AndersonDarlingTest",
+            "BWSTest",
+            "ChiSquareTest",
+            "CVMTest",
+            "KSTest",
+            "KuiperTest",
+            "MannWhitneyUTest",
+            "WelchTTest",
+        ]
+    },
+}
+
+# Subpackages are imported on first access too
+_SUBPACKAGES = {"distance_based", "statistical_test"}
+
+
+def __getattr__(name: str) -> Any:
+    """Import detectors lazily.
+
+    :param name: attribute name
+    :type name: str
+    :raises AttributeError: Attribute error exception
+    :return: attribute value
+    :rtype: Any
+    """
+    if name in _LAZY_IMPORTS:
+        module_name, attr_name = _LAZY_IMPORTS[name]
+        module = importlib.import_module(module_name, __name__)
+        value = getattr(module, attr_name)
+        # Cache it, so __getattr__ is not called again for this name
+        globals()[name] = value
+        return value
+    if name in _SUBPACKAGES:
+        # Importing a subpackage also sets it as an attribute of this package
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    """Module attributes, including the ones not imported yet.
+
+    :return: attribute names
+    :rtype: list[str]
+    """
+    return sorted({*globals(), *_LAZY_IMPORTS, *_SUBPACKAGES})
@@ -2,10 +2,12 @@
 
 import abc
 from collections import namedtuple
-from typing import Any, Tuple
+from typing import Any, Optional, Tuple, Union
 
 import numpy as np
 
+from frouros.callbacks.batch.base import BaseCallbackBatch
+from frouros.detectors.data_drift.base import BaseDataType, BaseStatisticalType
 from frouros.detectors.data_drift.batch.base import BaseDataDriftBatch
 
 StatisticalResult = namedtuple("StatisticalResult", ["statistic", "p_value"])
@@ -37,6 +39,92 @@ class BaseStatisticalTest(BaseDataDriftBatch):
         result = self._get_result(X=X, **kwargs)
         return result  # type: ignore
 
+    def update_reference(
+        self,
+        X: np.ndarray,  # noqa: N803
+        window_size: Optional[int] = None,
+    ) -> None:
+        """Update reference data with new samples.
+
+        New samples are appended to the reference data. If window size is set, only
+        the last window size samples are kept as reference data, so the oldest
+        samples are removed.
+
+        :param X: new reference samples
+        :type X: numpy.ndarray
+        :param window_size: number of most recent samples to keep, defaults to None
+        :type window_size: Optional[int]
+        :raises TypeError: Type error exception
+        :raises ValueError: Value error exception
+        """
+        if window_size is not None:
+            if isinstance(window_size, int) and not isinstance(window_size, bool):
+                if window_size <= 0:
+                    raise ValueError("window_size must be greater than 0 or None.")
+            else:
+                raise TypeError("window_size must be of type int or None.")
+        self._check_array(X=X)
+        self._check_is_fitted()
+        self._check_fit_dimensions(X=X)
+        self._check_compare_dimensions(X=X)
+        X_ref = np.concatenate([self.X_ref, X])  # noqa: N806
+        X_ref_removed = None  # noqa: N806
+        if window_size is not None and X_ref.shape[0] > window_size:
+            if window_size <= X.shape[0]:
+                # Window only holds new samples (some of them are removed too),
+                # so reference data is set (and sorted) from scratch
+                self.X_ref = X_ref[-window_size:]
+                return
+            # Otherwise, only old samples are removed
+            X_ref_removed = X_ref[:-window_size]  # noqa: N806
+            X_ref = X_ref[-window_size:]  # noqa: N806
+        self._update_reference(
+            X_ref=X_ref,
+            X_ref_added=X,
+            X_ref_removed=X_ref_removed,
+        )
+
+    def _update_reference(
+        self,
+        X_ref: np.ndarray,  # noqa: N803
+        X_ref_added: np.ndarray,  # noqa: N803
+        X_ref_removed: Optional[np.ndarray],  # noqa: N803
+    ) -> None:
+        # Cold path, reference data is set (and checked) from scratch
+        self.X_ref = X_ref
+
+    @staticmethod
+    def _update_sorted(
+        X_sorted: np.ndarray,  # noqa: N803
+        X_added: np.ndarray,  # noqa: N803
+        X_removed: Optional[np.ndarray] = None,  # noqa: N803
+    ) -> np.ndarray:
+        """Insert and remove samples from sorted data without sorting it again.
+
+        :param X_sorted: sorted data
+        :type X_sorted: numpy.ndarray
+        :param X_added: samples to insert
+        :type X_added: numpy.ndarray
+        :param X_removed: samples to remove, defaults to None
+        :type X_removed: Optional[numpy.ndarray]
+        :return: sorted data
+        :rtype: numpy.ndarray
+        """
+        if X_removed is not None and X_removed.shape[0] > 0:
+            X_removed = np.sort(X_removed)  # noqa: N806
+            # Repeated values to remove are located at consecutive positions
+            idxs = np.searchsorted(X_sorted, X_removed, side="left") + (
+                np.arange(X_removed.shape[0])
+                - np.searchsorted(X_removed, X_removed, side="left")
+            )
+            X_sorted = np.delete(X_sorted, idxs)  # noqa: N806
+        # Same type promotion as np.concatenate, so sorted data keeps matching
+        # the data it is computed from (e.g. integer data updated with floats)
+        dtype = np.result_type(X_sorted, X_added)
+        X_sorted = X_sorted.astype(dtype, copy=False)  # noqa: N806
+        X_added = np.sort(X_added.astype(dtype, copy=False))  # noqa: N806
+        return np.insert(X_sorted, np.searchsorted(X_sorted, X_added), X_added)
+
     @staticmethod
     @abc.abstractmethod
     def _statistical_test(
@@ -45,3 +133,115 @@ class BaseStatisticalTest(BaseDataDriftBatch):
         **kwargs: Any,
     ) -> StatisticalResult:
         pass
+
+
+class BaseSortedStatisticalTest(BaseStatisticalTest):
+    """Abstract class representing a statistical test with sorted reference data."""
+
+    def __init__(
+        self,
+        data_type: BaseDataType,
+        statistical_type: BaseStatisticalType,
+        callbacks: Optional[Union[BaseCallbackBatch, list[BaseCallbackBatch]]] = None,
+        dtype: Optional[Union[str, type, np.dtype]] = None,  # type: ignore
+    ) -> None:
+        """Init method.
+
+        :param data_type: data type
+        :type data_type: BaseDataType
+        :param statistical_type: statistical type
+        :type statistical_type: BaseStatisticalType
+        :param callbacks: callbacks
+        :type callbacks: Optional[Union[BaseCallbackBatch], list[BaseCallbackBatch]]
+        :param dtype: floating point type to which reference and test data are cast
+        :type dtype: Optional[Union[str, type, numpy.dtype]]
+        """
+        self.dtype = dtype  # type: ignore[assignment]
+        super().__init__(
+            data_type=data_type,
+            statistical_type=statistical_type,
+            callbacks=callbacks,
+        )
+
+    @property
+    def dtype(self) -> Optional[np.dtype]:  # type: ignore
+        """Data type property.
+
+        :return: floating point type to which data is cast
+        :rtype: Optional[numpy.dtype]
+        """
+        return self._dtype
+
+    @dtype.setter
+    def dtype(self, value: Optional[Union[str, type, np.dtype]]) -> None:  # type: ignore
+        """Data type setter.
+
+        :param value: value to be set
+        :type value: Optional[Union[str, type, numpy.dtype]]
+        :raises TypeError: Type error exception
+        """
+        if value is not None:
+            value = np.dtype(value)
+            if not np.issubdtype(value, np.floating):
+                raise TypeError("dtype must be a floating point type or None.")
+        self._dtype = value
+
+    @BaseStatisticalTest.X_ref.setter  # type: ignore[attr-defined]
+    def X_ref(self, value: Optional[np.ndarray]) -> None:  # noqa: N802
+        """Reference data setter.
+
+        :param value: value to be set
+        :type value: Optional[numpy.ndarray]
+        """
+        X_ref_sorted: Optional[np.ndarray] = None  # noqa: N806
+        if value is not None:
+            self._check_array(X=value)
+            value = self._cast(X=value)
+            self._check_reference(X=value)
+            if value.ndim == 1:
+                X_ref_sorted = np.sort(value)  # noqa: N806
+        self._X_ref_sorted = X_ref_sorted
+        self._update_sorted_cache()
+        self._X_ref = value
+
+    def _cast(self, X: np.ndarray) -> np.ndarray:  # noqa: N803
+        if self._dtype is None:
+            return X
+        return X.astype(self._dtype, copy=False)
+
+    def _check_reference(self, X: np.ndarray) -> None:  # noqa: N803
+        pass
+
+    def _update_sorted_cache(self) -> None:
+        # Data derived from sorted reference data is refreshed here
+        pass
+
+    def _update_reference(
+        self,
+        X_ref: np.ndarray,  # noqa: N803
+        X_ref_added: np.ndarray,  # noqa: N803
+        X_ref_removed: Optional[np.ndarray],  # noqa: N803
+    ) -> None:
+        if self._X_ref_sorted is None:
+            super()._update_reference(
+                X_ref=X_ref,
+                X_ref_added=X_ref_added,
+                X_ref_removed=X_ref_removed,
+            )
+            return
+        X_ref = self._cast(X=X_ref)  # noqa: N806
+        self._check_reference(X=X_ref)
+        self._X_ref_sorted = self._update_sorted(
+            X_sorted=self._X_ref_sorted,
+            X_added=self._cast(X=X_ref_added),
+            X_removed=X_ref_removed,
+        )
+        self._update_sorted_cache()
+        self._X_ref = X_ref
+
+    def _get_result(
+        self,
+        X: np.ndarray,  # noqa: N803
+        **kwargs: Any,
+    ) -> Union[list[float], list[Tuple[float, float]], Tuple[float, float]]:
+        return super()._get_result(X=self._cast(X=X), **kwargs)
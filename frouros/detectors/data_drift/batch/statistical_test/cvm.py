@@ -1,27 +1,33 @@
 """CVMTest (Cramér-von Mises test) module."""
 
-from typing import Any, Optional, Union
+from functools import lru_cache
+from typing import Any, Optional, Tuple, Union
 
 import numpy as np
 from scipy.stats import cramervonmises_2samp
+from scipy.stats._hypotests import _cdf_cvm_inf, _pval_cvm_2samp_exact
 
 from frouros.callbacks.batch.base import BaseCallbackBatch
 from frouros.detectors.data_drift.base import NumericalData, UnivariateData
 from frouros.detectors.data_drift.batch.statistical_test.base import (
-    BaseStatisticalTest,
+    BaseSortedStatisticalTest,
     StatisticalResult,
 )
 from frouros.detectors.data_drift.exceptions import InsufficientSamplesError
 
 
-class CVMTest(BaseStatisticalTest):
+class CVMTest(BaseSortedStatisticalTest):
     """CVMTest (Cramér-von Mises test) [cramer1928composition]_ detector.
 
     :param callbacks: callbacks, defaults to None
     :type callbacks: Optional[Union[BaseCallbackBatch, list[BaseCallbackBatch]]]
+    :param dtype: floating point type to which reference and test data are cast, defaults to None (data type is kept)
+    :type dtype: Optional[Union[str, type, numpy.dtype]]
 
     :Note:
     - Passing additional arguments to `scipy.stats.cramervonmises_2samp <https://docs.scipy.org/doc/scipy/reference/generated/scipy.stats.cramervonmises_2samp.html>`__ can be done using :func:`compare` kwargs.
+    - Using `dtype=numpy.float32` halves the memory traffic of sorting and searching large samples. Values that only differ beyond single precision become ties, so results may slightly differ from those computed in double precision.
+    - Reference data is sorted once when fitted, so :func:`compare` only sorts the test data and merges it with the sorted reference data to compute the statistic. :func:`update_reference` inserts (and removes) samples into the sorted reference data instead of sorting it again. p-values are memoized by sample sizes and statistic value.
 
     :References:
 
@@ -45,26 +51,17 @@ class CVMTest(BaseStatisticalTest):
     def __init__(  # noqa: D107
         self,
         callbacks: Optional[Union[BaseCallbackBatch, list[BaseCallbackBatch]]] = None,
+        dtype: Optional[Union[str, type, np.dtype]] = None,  # type: ignore
     ) -> None:
         super().__init__(
             data_type=NumericalData(),
             statistical_type=UnivariateData(),
             callbacks=callbacks,
+            dtype=dtype,
         )
 
-    @BaseStatisticalTest.X_ref.setter  # type: ignore[attr-defined]
-    def X_ref(self, value: Optional[np.ndarray]) -> None:  # noqa: N802
-        """Reference data setter.
-
-        :param value: value to be set
-        :type value: Optional[numpy.ndarray]
-        """
-        if value is not None:
-            self._check_sufficient_samples(X=value)
-            self._X_ref = value
-            # self._X_ref_ = check_array(value)  # noqa: N806
-        else:
-            self._X_ref = None  # noqa: N806
+    def _check_reference(self, X: np.ndarray) -> None:  # noqa: N803
+        self._check_sufficient_samples(X=X)
 
     def _specific_checks(self, X: np.ndarray) -> None:  # noqa: N803
         self._check_sufficient_samples(X=X)
@@ -74,6 +71,124 @@ class CVMTest(BaseStatisticalTest):
         if X.shape[0] < 2:
             raise InsufficientSamplesError("Number of samples must be at least 2.")
 
+    def _apply_method(
+        self,
+        X_ref: np.ndarray,  # noqa: N803
+        X: np.ndarray,
+        **kwargs: Any,
+    ) -> Tuple[float, float]:
+        method = kwargs.get("method", "auto")
+        if method == "auto":
+            # Same criterion as scipy.stats.cramervonmises_2samp
+            method = "asymptotic" if max(len(X_ref), len(X)) > 20 else "exact"
+        if (
+            method in ("asymptotic", "exact")
+            and kwargs.keys() <= {"method"}
+            and self._X_ref_sorted is not None
+            and X.ndim == 1
+        ):
+            X_sorted = np.sort(X)  # noqa: N806
+            # NaNs are sorted to the end, let scipy handle them
+            if not (np.isnan(self._X_ref_sorted[-1]) or np.isnan(X_sorted[-1])):
+                return self._statistical_test_presorted(
+                    X_ref_sorted=self._X_ref_sorted,
+                    X_sorted=X_sorted,
+                    method=method,
+                )
+        return super()._apply_method(X_ref=X_ref, X=X, **kwargs)
+
+    @staticmethod
+    def _statistical_test_presorted(
+        X_ref_sorted: np.ndarray,  # noqa: N803
+        X_sorted: np.ndarray,
+        method: str,
+    ) -> StatisticalResult:
+        """Cramér-von Mises two-sample test on sorted samples.
+
+        Equivalent to `scipy.stats.cramervonmises_2samp`, but the pooled ranks are
+        obtained by merging both sorted samples instead of ranking the whole pooled
+        sample from scratch, and scipy's input validation and result wrapping are
+        skipped.
+
+        :param X_ref_sorted: sorted reference data
+        :type X_ref_sorted: numpy.ndarray
+        :param X_sorted: sorted test data
+        :type X_sorted: numpy.ndarray
+        :param method: method used to compute the p-value, "asymptotic" or "exact"
+        :type method: str
+        :return: statistical result
+        :rtype: StatisticalResult
+        """
+        nx, ny = X_ref_sorted.size, X_sorted.size
+        z = np.concatenate((X_ref_sorted, X_sorted))
+        # Stable sort (timsort) merges the two sorted runs in linear time
+        order = np.argsort(z, kind="stable")
+        z_sorted = z[order]
+        # Midranks in case of ties
+        obs = np.concatenate(([True], z_sorted[1:] != z_sorted[:-1]))
+        dense = np.cumsum(obs)
+        count = np.append(np.nonzero(obs)[0], obs.size)
+        ranks = np.empty(z.size)
+        ranks[order] = 0.5 * (count[dense] + count[dense - 1] + 1)
+
+        u = nx * np.sum((ranks[:nx] - np.arange(1, nx + 1)) ** 2)
+        u += ny * np.sum((ranks[nx:] - np.arange(1, ny + 1)) ** 2)
+
+        k, n = nx * ny, nx + ny
+        statistic = u / (k * n) - (4 * k - 1) / (6 * n)
+
+        p_value = (
+            CVMTest._calculate_p_value_exact(
+                u=u,
+                X_ref_num_samples=nx,
+                X_num_samples=ny,
+            )
+            if method == "exact"
+            else CVMTest._calculate_p_value_aprox(
+                statistic=statistic,
+                X_ref_num_samples=nx,
+                X_num_samples=ny,
+            )
+        )
+        test = StatisticalResult(
+            statistic=statistic,
+            p_value=p_value,
+        )
+        return test
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _calculate_p_value_exact(
+        u: float,
+        X_ref_num_samples: int,  # noqa: N803
+        X_num_samples: int,
+    ) -> float:
+        # The exact distribution of U is built from scratch on every call, so
+        # it is memoized for repeated sample sizes and statistic values
+        return _pval_cvm_2samp_exact(u, X_ref_num_samples, X_num_samples)
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _calculate_p_value_aprox(
+        statistic: float,
+        X_ref_num_samples: int,  # noqa: N803
+        X_num_samples: int,
+    ) -> float:
+        # Uses scipy code adaptation to calculate approximate p-value. The
+        # statistic takes a finite set of values for given sample sizes, so the
+        # series evaluation in _cdf_cvm_inf is memoized
+        k, n = X_ref_num_samples * X_num_samples, X_ref_num_samples + X_num_samples
+        et = (1 + 1 / n) / 6
+        vt = (
+            (n + 1)
+            * (4 * k * n - 3 * (X_ref_num_samples**2 + X_num_samples**2) - 2 * k)
+            / (45 * n**2 * 4 * k)
+        )
+        tn = 1 / 6 + (statistic - et) / np.sqrt(45 * vt)
+        # If tn < 0.003, _cdf_cvm_inf(tn) < 1.28e-18
+        p_value = 1.0 if tn < 0.003 else max(0, 1.0 - _cdf_cvm_inf(tn))
+        return p_value
+
     @staticmethod
     def _statistical_test(
         X_ref: np.ndarray,  # noqa: N803
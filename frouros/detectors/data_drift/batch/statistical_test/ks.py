@@ -1,26 +1,38 @@
 """KSTest (Kolmogorov-Smirnov test) module."""
 
-from typing import Any, Optional, Union
+import math
+import warnings
+from functools import lru_cache
+from typing import Any, Optional, Tuple, Union
 
 import numpy as np
 from scipy.stats import ks_2samp
+from scipy.stats._stats_py import _attempt_exact_2kssamp
+from scipy.stats.distributions import kstwo
 
 from frouros.callbacks.batch.base import BaseCallbackBatch
 from frouros.detectors.data_drift.base import NumericalData, UnivariateData
 from frouros.detectors.data_drift.batch.statistical_test.base import (
-    BaseStatisticalTest,
+    BaseSortedStatisticalTest,
     StatisticalResult,
 )
 
+# Value used in scipy
+MAX_AUTO_N = 10000
 
-class KSTest(BaseStatisticalTest):
+
+class KSTest(BaseSortedStatisticalTest):
     """KSTest (Kolmogorov-Smirnov test) [massey1951kolmogorov]_ detector.
 
     :param callbacks: callbacks, defaults to None
     :type callbacks: Optional[Union[BaseCallbackBatch, list[BaseCallbackBatch]]]
+    :param dtype: floating point type to which reference and test data are cast, defaults to None (data type is kept)
+    :type dtype: Optional[Union[str, type, numpy.dtype]]
 
     :Note:
     - Passing additional arguments to `scipy.stats.ks_2samp <https://docs.scipy.org/doc/scipy/reference/generated/scipy.stats.ks_2samp.html>`__ can be done using :func:`compare` kwargs.
+    - Using `dtype=numpy.float32` halves the memory traffic of sorting and searching large samples. Values that only differ beyond single precision become ties, so results may slightly differ from those computed in double precision.
+    - Reference data is sorted once when fitted, together with its empirical distribution function evaluated at its own samples, so :func:`compare` only sorts the test data and searches it against the reference to compute the statistic. :func:`update_reference` inserts (and removes) samples into the sorted reference data instead of sorting it again. Exact p-values are memoized by sample sizes and statistic value.
 
     :References:
 
@@ -44,11 +56,185 @@ class KSTest(BaseStatisticalTest):
     def __init__(  # noqa: D107
         self,
         callbacks: Optional[Union[BaseCallbackBatch, list[BaseCallbackBatch]]] = None,
+        dtype: Optional[Union[str, type, np.dtype]] = None,  # type: ignore
     ) -> None:
         super().__init__(
             data_type=NumericalData(),
             statistical_type=UnivariateData(),
             callbacks=callbacks,
+            dtype=dtype,
+        )
+
+    def _update_sorted_cache(self) -> None:
+        self._X_ref_ecdf = (
+            self._calculate_ecdf_sorted(X=self._X_ref_sorted)
+            if self._X_ref_sorted is not None
+            else None
+        )
+
+    @staticmethod
+    def _calculate_ecdf_sorted(X: np.ndarray) -> np.ndarray:  # noqa: N803
+        # ECDF of sorted data evaluated at its own samples, equivalent to
+        # np.searchsorted(X, X, side="right") / X.shape[0] in linear time
+        ends = np.flatnonzero(np.append(X[1:] != X[:-1], True)) + 1
+        return np.repeat(ends, np.diff(ends, prepend=0)) / X.shape[0]
+
+    def _apply_method(
+        self,
+        X_ref: np.ndarray,  # noqa: N803
+        X: np.ndarray,
+        **kwargs: Any,
+    ) -> Tuple[float, float]:
+        alternative = kwargs.get("alternative", "two-sided")
+        method = kwargs.get("method", "auto")
+        if method == "auto":
+            # Same criterion as scipy.stats.ks_2samp
+            method = "exact" if max(len(X_ref), len(X)) <= MAX_AUTO_N else "asymp"
+        if (
+            method in ("exact", "asymp")
+            and alternative in ("two-sided", "less", "greater")
+            and self._X_ref_sorted is not None
+            and self._X_ref_ecdf is not None
+            and X.ndim == 1
+        ):
+            X_sorted = np.sort(X)  # noqa: N806
+            # NaNs are sorted to the end, let scipy handle them
+            if not (np.isnan(self._X_ref_sorted[-1]) or np.isnan(X_sorted[-1])):
+                return self._statistical_test_presorted(
+                    X_ref_sorted=self._X_ref_sorted,
+                    X_ref_ecdf=self._X_ref_ecdf,
+                    X_sorted=X_sorted,
+                    alternative=alternative,
+                    method=method,
+                )
+        # Method is already resolved, so scipy does not have to resolve it again
+        return super()._apply_method(X_ref=X_ref, X=X, **{**kwargs, "method": method})
+
+    @staticmethod
+    def _statistical_test_presorted(
+        X_ref_sorted: np.ndarray,  # noqa: N803
+        X_ref_ecdf: np.ndarray,
+        X_sorted: np.ndarray,
+        alternative: str,
+        method: str,
+    ) -> StatisticalResult:
+        X_ref_num_samples, X_num_samples = (  # noqa: N806
+            X_ref_sorted.shape[0],
+            X_sorted.shape[0],
+        )
+        statistic = KSTest._calculate_statistic(
+            X_ref=X_ref_sorted,
+            X_ref_ecdf=X_ref_ecdf,
+            X=X_sorted,
+            alternative=alternative,
+        )
+        if method == "exact":
+            gcd = math.gcd(X_ref_num_samples, X_num_samples)
+            if X_ref_num_samples // gcd >= np.iinfo(np.int32).max / (
+                X_num_samples // gcd
+            ):
+                method = "asymp"
+                warnings.warn(
+                    f"Exact ks_2samp calculation not possible with samples sizes "
+                    f"{X_ref_num_samples} and {X_num_samples}. Switching to 'asymp'.",
+                    RuntimeWarning,
+                    stacklevel=2,
+                )
+            else:
+                lcm = (X_ref_num_samples // gcd) * X_num_samples
+                success, exact_statistic, p_value = KSTest._calculate_p_value_exact(
+                    X_ref_num_samples=X_ref_num_samples,
+                    X_num_samples=X_num_samples,
+                    h=int(np.round(statistic * lcm)),
+                    alternative=alternative,
+                )
+                if success:
+                    statistic = exact_statistic
+                    p_value = np.clip(p_value, 0, 1)
+                else:
+                    method = "asymp"
+                    warnings.warn(
+                        "ks_2samp: Exact calculation unsuccessful. "
+                        "Switching to method=asymp.",
+                        RuntimeWarning,
+                        stacklevel=2,
+                    )
+        if method == "asymp":
+            p_value = KSTest._calculate_p_value_aprox(
+                X_ref_num_samples=X_ref_num_samples,
+                X_num_samples=X_num_samples,
+                statistic=statistic,
+                alternative=alternative,
+            )
+        test = StatisticalResult(statistic=np.float64(statistic), p_value=p_value)
+        return test
+
+    @staticmethod
+    def _calculate_statistic(
+        X_ref: np.ndarray,  # noqa: N803
+        X_ref_ecdf: np.ndarray,
+        X: np.ndarray,
+        alternative: str,
+    ) -> float:
+        # Uses scipy code adaptation to calculate statistic (distance) from
+        # sorted samples. Instead of evaluating both ECDFs at the concatenation
+        # of the samples, the differences are split into those at the reference
+        # samples (whose own ECDF is precomputed) and those at the test samples
+        X_ref_num_samples, X_num_samples = X_ref.shape[0], X.shape[0]  # noqa: N806
+        cddiffs_ref = (
+            X_ref_ecdf - np.searchsorted(X, X_ref, side="right") / X_num_samples
+        )
+        cddiffs = (
+            np.searchsorted(X_ref, X, side="right") / X_ref_num_samples
+            - np.searchsorted(X, X, side="right") / X_num_samples
+        )
+        min_s = np.clip(-min(np.min(cddiffs_ref), np.min(cddiffs)), 0, 1)
+        max_s = max(np.max(cddiffs_ref), np.max(cddiffs))
+        if alternative == "less" or (alternative == "two-sided" and min_s > max_s):
+            statistic = min_s
+        else:
+            statistic = max_s
+        return statistic
+
+    @staticmethod
+    def _calculate_p_value_aprox(
+        X_ref_num_samples: int,  # noqa: N803
+        X_num_samples: int,
+        statistic: float,
+        alternative: str,
+    ) -> float:
+        # Uses scipy code adaptation to calculate approximate p-value
+        m, n = sorted([float(X_ref_num_samples), float(X_num_samples)], reverse=True)
+        en = m * n / (m + n)
+        if alternative == "two-sided":
+            p_value = kstwo.sf(statistic, np.round(en))
+        else:
+            z = np.sqrt(en) * statistic
+            # Use Hodges' suggested approximation Eqn 5.3
+            # Requires m to be the larger of (n1, n2)
+            expt = -2 * z**2 - 2 * z * (m + 2 * n) / np.sqrt(m * n * (m + n)) / 3.0
+            p_value = np.exp(expt)
+        return np.clip(p_value, 0, 1)
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _calculate_p_value_exact(
+        X_ref_num_samples: int,  # noqa: N803
+        X_num_samples: int,
+        h: int,
+        alternative: str,
+    ) -> Tuple[bool, float, float]:
+        # The exact p-value only depends on the sample sizes and the statistic
+        # expressed as an integer number of steps (h) of size 1 / lcm(n1, n2),
+        # so it can be memoized across calls of the same size
+        gcd = math.gcd(X_ref_num_samples, X_num_samples)
+        lcm = (X_ref_num_samples // gcd) * X_num_samples
+        return _attempt_exact_2kssamp(  # type: ignore
+            X_ref_num_samples,
+            X_num_samples,
+            gcd,
+            h / lcm,
+            alternative,
         )
 
     @staticmethod
@@ -1,11 +1,14 @@
 """Test data drift detectors."""
 
-from typing import Any, Tuple, Union
+import subprocess
+import sys
+from typing import Any, Callable, Optional, Tuple, Type, Union
 
 import numpy as np
 import pytest
-from scipy.stats import PermutationMethod
+from scipy.stats import PermutationMethod, cramervonmises_2samp, ks_2samp
 
+from frouros.callbacks.batch import ResetStatisticalTest
 from frouros.detectors.data_drift.batch import (
     EMD,
     JS,
@@ -214,6 +217,328 @@ def test_batch_statistical_univariate(
     assert np.isclose(p_value, expected_p_value)
 
 
+@pytest.mark.parametrize(
+    "detector, scipy_test, kwargs",
+    [
+        (CVMTest(), cramervonmises_2samp, {}),
+        (KSTest(), ks_2samp, {}),
+        (KSTest(), ks_2samp, {"alternative": "greater"}),
+        (KSTest(), ks_2samp, {"method": "asymp"}),
+        (KSTest(), ks_2samp, {"method": "asymp", "alternative": "less"}),
+    ],
+)
+@pytest.mark.parametrize("decimals", [None, 1])
+def test_batch_statistical_univariate_sorted_reference(
+    X_ref_univariate: np.ndarray,  # noqa: N803
+    X_test_univariate: np.ndarray,  # noqa: N803
+    detector: BaseDataDriftBatch,
+    scipy_test: Callable,  # type: ignore
+    kwargs: Any,
+    decimals: Optional[int],
+) -> None:
+    """Test statistical univariate methods that cache the sorted reference data.
+
+    :param X_ref_univariate: reference univariate data
+    :type X_ref_univariate: numpy.ndarray
+    :param X_test_univariate: test univariate data
+    :type X_test_univariate: numpy.ndarray
+    :param detector: detector test
+    :type detector: BaseDataDriftBatch
+    :param scipy_test: scipy equivalent test
+    :type scipy_test: Callable
+    :param kwargs: additional arguments
+    :type kwargs: Any
+    :param decimals: number of decimals to round the data to (forces ties)
+    :type decimals: Optional[int]
+    """
+    if decimals is not None:
+        X_ref_univariate = np.round(X_ref_univariate, decimals)  # noqa: N806
+        X_test_univariate = np.round(X_test_univariate, decimals)  # noqa: N806
+    expected = scipy_test(X_ref_univariate, X_test_univariate, **kwargs)
+
+    _ = detector.fit(X=X_ref_univariate)
+    (statistic, p_value), _ = detector.compare(X=X_test_univariate, **kwargs)
+
+    assert np.isclose(statistic, expected.statistic)
+    assert np.isclose(p_value, expected.pvalue)
+
+
+@pytest.mark.parametrize(
+    "detector, scipy_test",
+    [
+        (CVMTest(), cramervonmises_2samp),
+        (KSTest(), ks_2samp),
+    ],
+)
+def test_batch_statistical_univariate_sorted_reference_small_samples(
+    univariate_distribution_p: Tuple[float, float],
+    univariate_distribution_q: Tuple[float, float],
+    detector: BaseDataDriftBatch,
+    scipy_test: Callable,  # type: ignore
+    num_samples: int = 15,
+) -> None:
+    """Test statistical univariate methods that cache the sorted reference data.
+
+    Small samples use the exact distribution to compute the p-value.
+
+    :param univariate_distribution_p: mean and standard deviation of distribution p
+    :type univariate_distribution_p: Tuple[float, float]
+    :param univariate_distribution_q: mean and standard deviation of distribution q
+    :type univariate_distribution_q: Tuple[float, float]
+    :param detector: detector test
+    :type detector: BaseDataDriftBatch
+    :param scipy_test: scipy equivalent test
+    :type scipy_test: Callable
+    :param num_samples: number of random samples
+    :type num_samples: int
+    """
+    np.random.seed(seed=31)
+    X_ref = np.random.normal(*univariate_distribution_p, size=num_samples)  # noqa: N806
+    _ = detector.fit(X=X_ref)
+
+    for _ in range(2):
+        X_test = np.random.normal(  # noqa: N806
+            *univariate_distribution_q, size=num_samples - 3
+        )
+        expected = scipy_test(X_ref, X_test)
+        (statistic, p_value), _ = detector.compare(X=X_test)
+
+        assert np.isclose(statistic, expected.statistic)
+        assert np.isclose(p_value, expected.pvalue)
+
+
+@pytest.mark.parametrize(
+    "detector_class, scipy_test",
+    [
+        (CVMTest, cramervonmises_2samp),
+        (KSTest, ks_2samp),
+    ],
+)
+def test_batch_statistical_univariate_dtype(
+    X_ref_univariate: np.ndarray,  # noqa: N803
+    X_test_univariate: np.ndarray,  # noqa: N803
+    detector_class: Type[BaseDataDriftBatch],
+    scipy_test: Callable,  # type: ignore
+) -> None:
+    """Test statistical univariate methods casting the data to single precision.
+
+    :param X_ref_univariate: reference univariate data
+    :type X_ref_univariate: numpy.ndarray
+    :param X_test_univariate: test univariate data
+    :type X_test_univariate: numpy.ndarray
+    :param detector_class: detector class
+    :type detector_class: Type[BaseDataDriftBatch]
+    :param scipy_test: scipy equivalent test
+    :type scipy_test: Callable
+    """
+    detector = detector_class(dtype=np.float32)  # type: ignore
+    expected = scipy_test(X_ref_univariate, X_test_univariate)
+
+    _ = detector.fit(X=X_ref_univariate)
+    (statistic, p_value), _ = detector.compare(X=X_test_univariate)
+
+    assert detector.X_ref.dtype == np.float32  # type: ignore
+    assert np.isclose(statistic, expected.statistic)
+    assert np.isclose(p_value, expected.pvalue)
+
+
+@pytest.mark.parametrize("detector_class", [CVMTest, KSTest])
+@pytest.mark.parametrize(
+    "num_new_samples, window_size",
+    [
+        (25, None),
+        (25, 100),
+        (50, 60),
+        (50, 50),
+        (50, 30),
+        (150, 100),
+    ],
+)
+@pytest.mark.parametrize("decimals", [None, 1])
+def test_batch_statistical_univariate_update_reference(
+    detector_class: Type[BaseDataDriftBatch],
+    num_new_samples: int,
+    window_size: Optional[int],
+    decimals: Optional[int],
+    num_samples: int = 100,
+) -> None:
+    """Test statistical univariate methods updating the reference data.
+
+    :param detector_class: detector class
+    :type detector_class: Type[BaseDataDriftBatch]
+    :param num_new_samples: number of new reference samples in each update
+    :type num_new_samples: int
+    :param window_size: number of most recent samples to keep
+    :type window_size: Optional[int]
+    :param decimals: number of decimals to round the data to (forces ties)
+    :type decimals: Optional[int]
+    :param num_samples: number of random samples
+    :type num_samples: int
+    """
+    np.random.seed(seed=31)
+    X_ref = np.random.normal(size=num_samples)  # noqa: N806
+    X_test = np.random.normal(loc=0.5, size=num_samples)  # noqa: N806
+    if decimals is not None:
+        X_ref = np.round(X_ref, decimals)  # noqa: N806
+        X_test = np.round(X_test, decimals)  # noqa: N806
+    detector = detector_class()  # type: ignore
+    _ = detector.fit(X=X_ref)
+
+    for _ in range(3):
+        X_new = np.random.normal(loc=0.25, size=num_new_samples)  # noqa: N806
+        if decimals is not None:
+            X_new = np.round(X_new, decimals)  # noqa: N806
+        X_ref = np.concatenate([X_ref, X_new])  # noqa: N806
+        if window_size is not None:
+            X_ref = X_ref[-window_size:]  # noqa: N806
+        detector.update_reference(  # type: ignore
+            X=X_new,
+            window_size=window_size,
+        )
+        expected_detector = detector_class()  # type: ignore
+        _ = expected_detector.fit(X=X_ref)
+
+        assert np.array_equal(detector.X_ref, X_ref)  # type: ignore
+        assert np.array_equal(
+            detector._X_ref_sorted,  # type: ignore
+            np.sort(X_ref),
+        )
+        assert detector.compare(X=X_test)[0] == expected_detector.compare(X=X_test)[0]
+
+
+@pytest.mark.parametrize("detector_class", [CVMTest, KSTest])
+@pytest.mark.parametrize("window_size", [None, 150])
+def test_batch_statistical_univariate_update_reference_upcast(
+    detector_class: Type[BaseDataDriftBatch],
+    window_size: Optional[int],
+    num_samples: int = 100,
+) -> None:
+    """Test statistical univariate methods updating integer data with floats.
+
+    :param detector_class: detector class
+    :type detector_class: Type[BaseDataDriftBatch]
+    :param window_size: number of most recent samples to keep
+    :type window_size: Optional[int]
+    :param num_samples: number of random samples
+    :type num_samples: int
+    """
+    np.random.seed(seed=31)
+    X_ref = np.random.randint(low=-3, high=3, size=num_samples)  # noqa: N806
+    X_new = np.random.normal(loc=0.25, size=num_samples)  # noqa: N806
+    X_test = np.random.normal(loc=0.5, size=num_samples)  # noqa: N806
+    detector = detector_class()  # type: ignore
+    _ = detector.fit(X=X_ref)
+    detector.update_reference(  # type: ignore
+        X=X_new,
+        window_size=window_size,
+    )
+    X_ref = np.concatenate([X_ref, X_new])[-(window_size or 0) :]  # noqa: N806
+    expected_detector = detector_class()  # type: ignore
+    _ = expected_detector.fit(X=X_ref)
+
+    assert np.array_equal(
+        detector._X_ref_sorted,  # type: ignore
+        np.sort(X_ref),
+    )
+    assert detector.compare(X=X_test)[0] == expected_detector.compare(X=X_test)[0]
+
+
+def test_batch_statistical_univariate_update_reference_invalid_type(
+    X_ref_univariate: np.ndarray,  # noqa: N803
+) -> None:
+    """Test statistical univariate methods update reference invalid type.
+
+    :param X_ref_univariate: reference univariate data
+    :type X_ref_univariate: numpy.ndarray
+    """
+    detector = KSTest()
+    _ = detector.fit(X=X_ref_univariate)
+
+    with pytest.raises(TypeError):
+        detector.update_reference(X=X_ref_univariate.tolist())
+
+
+@pytest.mark.parametrize(
+    "window_size, expected_exception",
+    [
+        (1.5, TypeError),
+        ("10", TypeError),
+        (True, TypeError),
+        (0, ValueError),
+    ],
+)
+def test_batch_statistical_univariate_update_reference_window_size_invalid(
+    X_ref_univariate: np.ndarray,  # noqa: N803
+    window_size: Union[int, float, str, bool],
+    expected_exception: Type[Exception],
+) -> None:
+    """Test statistical univariate methods update reference invalid window size.
+
+    :param X_ref_univariate: reference univariate data
+    :type X_ref_univariate: numpy.ndarray
+    :param window_size: window size
+    :type window_size: Union[int, float, str, bool]
+    :param expected_exception: expected exception
+    :type expected_exception: Type[Exception]
+    """
+    detector = KSTest()
+    _ = detector.fit(X=X_ref_univariate)
+
+    with pytest.raises(expected_exception):
+        detector.update_reference(
+            X=X_ref_univariate,
+            window_size=window_size,  # type: ignore
+        )
+
+
+@pytest.mark.parametrize("detector_class", [CVMTest, KSTest])
+def test_batch_statistical_univariate_dtype_positional_callbacks(
+    detector_class: Type[BaseDataDriftBatch],
+) -> None:
+    """Test statistical univariate methods keep callbacks as first argument.
+
+    :param detector_class: detector class
+    :type detector_class: Type[BaseDataDriftBatch]
+    """
+    callback = ResetStatisticalTest(alpha=0.01)
+    detector = detector_class(callback)  # type: ignore
+
+    assert detector.callbacks == [callback]
+    assert detector.dtype is None  # type: ignore
+
+
+@pytest.mark.parametrize("detector_class", [CVMTest, KSTest])
+def test_batch_statistical_univariate_dtype_invalid_reference(
+    detector_class: Type[BaseDataDriftBatch],
+) -> None:
+    """Test statistical univariate methods casting non-array reference data.
+
+    :param detector_class: detector class
+    :type detector_class: Type[BaseDataDriftBatch]
+    """
+    detector = detector_class(dtype=np.float32)  # type: ignore
+
+    with pytest.raises(TypeError):
+        detector.X_ref = [0.0, 1.0, 2.0]  # type: ignore
+
+
+@pytest.mark.parametrize("detector_class", [CVMTest, KSTest])
+@pytest.mark.parametrize("dtype", [int, "int32", "foo"])
+def test_batch_statistical_univariate_dtype_invalid(
+    detector_class: Type[BaseDataDriftBatch],
+    dtype: Union[type, str],
+) -> None:
+    """Test statistical univariate methods invalid dtype.
+
+    :param detector_class: detector class
+    :type detector_class: Type[BaseDataDriftBatch]
+    :param dtype: data type
+    :type dtype: Union[type, str]
+    """
+    with pytest.raises(TypeError):
+        _ = detector_class(dtype=dtype)  # type: ignore
+
+
 @pytest.mark.parametrize("detector, expected_distance", [(MMD(), 0.10163633)])
 def test_batch_distance_based_multivariate_different_distribution(
     X_ref_multivariate: np.ndarray,  # noqa: N803
@@ -464,3 +789,33 @@ def test_streaming_distance_based_univariate_different_distribution(
 
     # Check last distance
     assert np.isclose(result.distance, expected_distance)
+
+
+@pytest.mark.parametrize(
+    "attribute",
+    [
+        "batch",
+        "streaming",
+        "batch.distance_based",
+        "batch.statistical_test",
+        "batch.KSTest",
+        "MMDStreaming",
+    ],
+)
+def test_data_drift_lazy_attribute_access(attribute: str) -> None:
+    """Test data drift package attribute access with lazy imports.
+
+    A new interpreter is used, so no subpackage has been imported beforehand.
+
+    :param attribute: attribute path from data drift package
+    :type attribute: str
+    """
+    code = f"import frouros.detectors.data_drift as dd; dd.{attribute}"
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=False,
+        text=True,
+    )
+
+    assert result.returncode == 0, result.stderr